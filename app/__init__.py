@@ -7,13 +7,26 @@ from flask_cors import CORS
 
 from app.routes import register_routes
 from app.settings import LIMITER, MONGO_CLIENT, MONGO_URI
+from app.utils import OrjsonProvider
 
 app = Flask(__name__)
 app.url_map.strict_slashes = False  # Includes trailing slashes
+app.json = OrjsonProvider(app)
 
 LIMITER.init_app(app)
 
-MONGO_CLIENT.init_app(app, uri=MONGO_URI)
+# Bounded connection pool so gunicorn workers neither open unbounded
+# connections under bursts nor block indefinitely waiting for a socket.
+MONGO_CLIENT.init_app(
+    app,
+    uri=MONGO_URI,
+    maxPoolSize=50,
+    minPoolSize=5,
+    maxConnecting=4,
+    maxIdleTimeMS=60000,
+    waitQueueTimeoutMS=2000,
+    serverSelectionTimeoutMS=3000,
+)
 
 CORS(app)
 
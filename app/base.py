@@ -5,69 +5,193 @@ Base Views Module
 from abc import ABC
 from http import HTTPStatus
 
+import orjson
 from argon2.exceptions import HashingError
 from flask import Response, request
 from flask.views import MethodView
 from marshmallow import Schema, ValidationError
 
 from app.enums import ResponseMessages
-from app.helpers import authenticate_user
+from app.exceptions import BaseHTTPException
+from app.helpers import authenticate_user, token_bucket
 from app.settings import LIMITER, LOGGER
 from app.utils import make_response
 
+# Enum member and .value lookups bound once at import so the request path
+# pays a single global load instead of repeated attribute resolution.
+_BAD_REQUEST = HTTPStatus.BAD_REQUEST
+_INTERNAL_SERVER_ERROR = HTTPStatus.INTERNAL_SERVER_ERROR
+_SOMETHING_WENT_WRONG = ResponseMessages.SOMETHING_WENT_WRONG.value
 
-class BaseAuthView(MethodView):
+_SCHEMA_CACHE: dict = {}
+
+# The invalid-request 400 body only varies in its details, so the constant
+# JSON frame is precomputed as bytes and just the messages are serialized.
+_INVALID_RESPONSE_PREFIX = b'{"message":"Invalid request data.","data":{},"details":'
+_INVALID_RESPONSE_SUFFIX = b"}"
+
+
+def _validation_error_response(error: ValidationError) -> tuple[Response, HTTPStatus]:
     """
-    Base class for auth API views
+    Function to build the response for a request payload validation failure.
+    Shared by every view so the error handling lives (and is optimized) in one place.
+
+    Args:
+        error (ValidationError): Validation error raised while loading the payload.
+
+    Returns:
+        tuple[Response, HTTPStatus]: Response, status code.
     """
-    
-    decorators = [LIMITER.limit("100/hour"), LIMITER.limit("10/minute")]
-    payload_schema: Schema = None
-    processor_class = None
-    success_message: str = None
-    
-    def post(self) -> tuple[Response, HTTPStatus]:
+
+    error_messages: dict = error.messages if isinstance(error.messages, dict) else error.normalized_messages()
+    LOGGER.warning("Validation error: %s", error_messages)
+    body: bytes = _INVALID_RESPONSE_PREFIX + orjson.dumps(error_messages, default=str) + _INVALID_RESPONSE_SUFFIX
+    return Response(body, status=_BAD_REQUEST, mimetype="application/json"), _BAD_REQUEST
+
+
+def _get_schema(schema_class: type, context: dict = None) -> Schema:
+    """
+    Function to get a schema instance for a view.
+    Context-free schemas are cached per class and shared across requests,
+    skipping the field-binding walk of construction. Schemas that carry
+    request context are built fresh: gunicorn runs threaded workers, and
+    setting context on a shared instance would leak one request's view args
+    into a concurrent request's validation.
+
+    Args:
+        schema_class (type): Schema class of the view.
+        context (dict, optional): Request view args and request args. Defaults to None.
+
+    Returns:
+        Schema: Schema instance.
+    """
+
+    if context:
+        return schema_class(context=context)
+
+    schema: Schema = _SCHEMA_CACHE.get(schema_class)
+    if schema is None:
+        schema = _SCHEMA_CACHE.setdefault(schema_class, schema_class())
+    return schema
+
+
+def _make_auth_post(cls: type):
+    """
+    Function to build the specialized post handler for an auth view class.
+    The view attributes are fixed once the class body has run, so they are
+    captured as closure cells and each request loads them with LOAD_DEREF
+    instead of walking the instance and class dicts per lookup.
+
+    Args:
+        cls (type): Concrete BaseAuthView subclass.
+
+    Returns:
+        Callable: Post handler bound to the class attributes.
+    """
+
+    fast_validator = cls.fast_validator
+    payload_schema = cls.payload_schema
+    processor_class = cls.processor_class
+    success_message = cls.success_message
+    handled_exceptions = cls.handled_exceptions
+
+    # Keyword defaults below pre-bind hot globals as locals (LOAD_FAST instead
+    # of LOAD_GLOBAL per lookup); Flask never passes these parameters.
+    def post(
+        self,
+        make_response=make_response,
+        _get_schema=_get_schema,
+        _validation_error_response=_validation_error_response,
+    ) -> tuple[Response, HTTPStatus]:
         """
         Post method for auth API views.
 
         Returns:
             tuple[Response, HTTPStatus]: Response, status code
         """
-        
-        request_data: dict = request.get_json()
-        
+
+        request_data: dict = request.get_json(silent=True) or {}
+
         try:
-            validated_data: dict = self.payload_schema().load(request_data)
-            data: dict = self.processor_class(validated_data).process()
-            return make_response(message=self.success_message, data=data)
+            if fast_validator is not None:
+                validated_data: dict = fast_validator(request_data)
+            else:
+                validated_data: dict = _get_schema(payload_schema).load(request_data)
+            data: dict = processor_class(validated_data).process()
+            return make_response(message=success_message, data=data)
 
         except ValidationError as error:
-            error_messages: dict = error.messages if isinstance(error.messages, dict) else error.normalized_messages()
-            LOGGER.warning(f"Validation error: {error_messages}")
-            return make_response(
-                message=ResponseMessages.INVALID_REQUEST_DATA.value,
-                errors={"details": error_messages},
-                status_code=HTTPStatus.BAD_REQUEST
-            )
+            return _validation_error_response(error)
+
+        except handled_exceptions as error:
+            LOGGER.warning("%s: %s", type(error).__name__, error.message)
+            return make_response(message=error.message, status_code=error.status_code)
 
         except HashingError as error:
             LOGGER.warning(f"Error while hashing access code: {error.args[0]}")
             return make_response(
-                message=ResponseMessages.SOMETHING_WENT_WRONG.value, status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                message=_SOMETHING_WENT_WRONG, status_code=_INTERNAL_SERVER_ERROR,
             )
 
+    return post
 
-class BaseAuthenticationView(MethodView, ABC):
+
+class BaseAuthView(MethodView):
     """
-    Base class for view requiring token authentication
+    Base class for auth API views
     """
-    
-    decorators = [authenticate_user, LIMITER.limit("100/hour"), LIMITER.limit("10/minute")]
+
+    # MethodView applies decorators innermost-first, so the in-process token
+    # bucket goes last to run first: bot bursts on the unauthenticated routes
+    # are dropped with a dict lookup before the limiter's Redis round trip.
+    decorators = [LIMITER.limit("10/minute;100/hour"), token_bucket()]
+    fast_validator = None
+    handled_exceptions: tuple = (BaseHTTPException,)
     payload_schema: Schema = None
     processor_class = None
     success_message: str = None
-    
-    def handle_request(self, request_data: dict, context: dict = None) -> tuple[Response, HTTPStatus]:
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Function to specialize the post handler per concrete view class.
+        Runs before MethodView's subclass hook so the generated handler is in
+        place when the allowed methods are collected.
+        """
+
+        if cls.processor_class is not None and "post" not in cls.__dict__:
+            cls.post = _make_auth_post(cls)
+        super().__init_subclass__(**kwargs)
+
+
+def _make_handle_request(cls: type):
+    """
+    Function to build the specialized handle_request for an authenticated view
+    class. Same specialization as _make_auth_post: the fixed view attributes
+    become closure cells instead of per-request attribute lookups.
+
+    Args:
+        cls (type): Concrete BaseAuthenticationView subclass.
+
+    Returns:
+        Callable: Request handler bound to the class attributes.
+    """
+
+    fast_validator = cls.fast_validator
+    payload_schema = cls.payload_schema
+    processor_class = cls.processor_class
+    success_message = cls.success_message
+    handled_exceptions = cls.handled_exceptions
+
+    # Keyword defaults below pre-bind hot globals as locals; callers only ever
+    # pass request_data and context.
+    def handle_request(
+        self,
+        request_data: dict,
+        context: dict = None,
+        make_response=make_response,
+        _get_schema=_get_schema,
+        _validation_error_response=_validation_error_response,
+    ) -> tuple[Response, HTTPStatus]:
         """
         Function to handle request.
 
@@ -78,22 +202,57 @@ class BaseAuthenticationView(MethodView, ABC):
         Returns:
             tuple[Response, HTTPStatus]: Response, status code
         """
-        
+
         user: dict = request.user
-        
+
         try:
-            validated_data: dict = self.payload_schema(context=context).load(request_data)
-            data: dict = self.processor_class(validated_data, user).process()
-            return make_response(message=self.success_message, data=data)
+            if fast_validator is not None:
+                # Same merge the marshmallow pre_load hooks do: view args and
+                # query params join the payload before validation.
+                if context:
+                    request_data = {
+                        **request_data,
+                        **{key: value for key, value in context.items() if value is not None},
+                    }
+                validated_data: dict = fast_validator(request_data)
+            else:
+                validated_data: dict = _get_schema(payload_schema, context).load(request_data)
+            data: dict = processor_class(validated_data, user).process()
+            return make_response(message=success_message, data=data)
 
         except ValidationError as error:
-            error_messages: dict = error.messages if isinstance(error.messages, dict) else error.normalized_messages()
-            LOGGER.warning(f"Validation error: {error_messages}")
-            return make_response(
-                message=ResponseMessages.INVALID_REQUEST_DATA.value,
-                errors={"details": error_messages},
-                status_code=HTTPStatus.BAD_REQUEST
-            )
+            return _validation_error_response(error)
+
+        except handled_exceptions as error:
+            LOGGER.warning("%s: %s", type(error).__name__, error.message)
+            return make_response(message=error.message, status_code=error.status_code)
+
+    return handle_request
+
+
+class BaseAuthenticationView(MethodView, ABC):
+    """
+    Base class for view requiring token authentication
+    """
+
+    # MethodView applies decorators innermost-first, so authenticate_user goes
+    # last to run first: requests with a bad token are rejected before the
+    # limiter spends a Redis round trip on them.
+    decorators = [LIMITER.limit("10/minute;100/hour"), authenticate_user]
+    fast_validator = None
+    handled_exceptions: tuple = (BaseHTTPException,)
+    payload_schema: Schema = None
+    processor_class = None
+    success_message: str = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Function to specialize handle_request per concrete view class.
+        """
+
+        if cls.processor_class is not None and "handle_request" not in cls.__dict__:
+            cls.handle_request = _make_handle_request(cls)
+        super().__init_subclass__(**kwargs)
 
 
 class BaseNoteView(BaseAuthenticationView):
@@ -138,7 +297,7 @@ class BaseNoteView(BaseAuthenticationView):
             tuple[Response, HTTPStatus]: Response, status code.
         """
         
-        request_data = request.get_json()
+        request_data = request.get_json(silent=True) or {}
         return self.handle_request(request_data, {"note_id": note_id})
 
     def put(self, note_id: str) -> tuple[Response, HTTPStatus]:
@@ -152,5 +311,5 @@ class BaseNoteView(BaseAuthenticationView):
             tuple[Response, HTTPStatus]: Response, status code.
         """
 
-        request_data = request.get_json()
+        request_data = request.get_json(silent=True) or {}
         return self.handle_request(request_data, {"note_id": note_id})
@@ -2,7 +2,14 @@
 Constants Module
 """
 
+import re
+
 ACCESS_TOKEN_VALIDITY = 1  # 1 day
 
 REGEX_NAME = r"^([A-Za-z]+([-'][A-Za-z]+)*)$"
 REGEX_PASSWORD = r"^(?=.*\W)(?=.*[0-9])(?=.*[a-zA-Z])(?=.*[!\"#$%&'()*+,-./:;<=>?@[\]^_`{|}~]).*$"
+
+# Compiled once at import so validators never pay a re.compile (or a re cache
+# lookup) on the request path.
+NAME_PATTERN = re.compile(REGEX_NAME)
+PASSWORD_PATTERN = re.compile(REGEX_PASSWORD)
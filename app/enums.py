@@ -4,12 +4,13 @@ Enums Module
 
 from enum import Enum
 
-# Argon2 hashing. Do not change these value. Changing the following 
-# values will result in generation of different hash for same input.
+# Argon2 hashing costs. Stored hashes are PHC-encoded and embed their own
+# parameters, so changing these values only affects newly created hashes.
 
-class Argon2IdHash(Enum):
+class Argon2IdHash(int, Enum):
     """
-    Enum for argon2id hashing constants
+    Enum for argon2id hashing constants.
+    Members are int subclasses, so they can be used directly without .value.
     """
 
     TIME_COST = 8
@@ -18,9 +19,10 @@ class Argon2IdHash(Enum):
     HASH_LENGTH = 16
 
 
-class ErrorMessages(Enum):
+class ErrorMessages(str, Enum):
     """
-    Enum for error messages
+    Enum for error messages.
+    Members are str subclasses, so they can be used directly without .value.
     """
 
     INVALID_NAME = "Only A-Z letters and non-consecutive apostrophes(') and/or dashes(-) are allowed."
@@ -28,9 +30,10 @@ class ErrorMessages(Enum):
     SHORT_PASSWORD = "Password should contain at least 6 characters."
 
 
-class ExceptionMessages(Enum):
+class ExceptionMessages(str, Enum):
     """
-    Enum for exception messages
+    Enum for exception messages.
+    Members are str subclasses, so they can be used directly without .value.
     """
 
     DOCUMENT_DOES_NOT_EXIST = "Document does not exists."
@@ -42,17 +45,20 @@ class ExceptionMessages(Enum):
     USER_ALREADY_EXISTS = "User already exists."
 
 
-class ResponseMessages(Enum):
+class ResponseMessages(str, Enum):
     """
-    Enum for response messages
+    Enum for response messages.
+    Members are str subclasses, so they can be used directly without .value.
     """
 
     INVALID_REQUEST_DATA = "Invalid request data."
     NOTE_CREATED_SUCCESSFULLY = "Note created successfully."
+    NOTES_CREATED_SUCCESSFULLY = "Notes created successfully."
     NOTE_DELETED_SUCCESSFULLY = "Note deleted successfully."
     NOTE_FETCHED_SUCCESSFULLY = "Note(s) fetched successfully."
     NOTE_SHARED_SUCCESSFULLY = "Note shared successfully."
     NOTE_UPDATED_SUCCESSFULLY = "Note updated successfully."
     SOMETHING_WENT_WRONG = "Something went wrong, please try again."
+    TOO_MANY_REQUESTS = "Too many requests, please try again later."
     USER_CREATED_SUCCESSFULLY = "User created successfully."
     USER_LOGGED_IN_SUCCESSFULLY = "User logged in successfully."
@@ -12,6 +12,13 @@ class BaseHTTPException(Exception):
     Base exception
     """
 
+    # Slots keep message/status_code out of the instance __dict__; the class
+    # defaults use distinct names so they don't shadow the slot descriptors.
+    __slots__ = ("message", "status_code")
+
+    default_message: str = None
+    default_status_code: HTTPStatus = None
+
     def __init__(self, message: str = None, status_code: HTTPStatus = None) -> None:
         """
         Initialization Function.
@@ -22,8 +29,8 @@ class BaseHTTPException(Exception):
         """
 
         super().__init__()
-        self.message = message or self.message
-        self.status_code = status_code or self.status_code
+        self.message = message or self.default_message
+        self.status_code = status_code or self.default_status_code
 
 
 class AlreadySharedException(BaseHTTPException):
@@ -31,8 +38,10 @@ class AlreadySharedException(BaseHTTPException):
     Already shared exception
     """
 
-    message = ExceptionMessages.NOTE_ALREADY_SHARED.value
-    status_code = HTTPStatus.BAD_REQUEST
+    __slots__ = ()
+
+    default_message = ExceptionMessages.NOTE_ALREADY_SHARED.value
+    default_status_code = HTTPStatus.BAD_REQUEST
 
 
 class CannotShareNoteToYourselfException(BaseHTTPException):
@@ -40,8 +49,10 @@ class CannotShareNoteToYourselfException(BaseHTTPException):
     Cannot share a note to your self exception
     """
 
-    message = ExceptionMessages.NOTE_CANNOT_BE_SHARED_WITH_YOURSELF.value
-    status_code = HTTPStatus.BAD_REQUEST
+    __slots__ = ()
+
+    default_message = ExceptionMessages.NOTE_CANNOT_BE_SHARED_WITH_YOURSELF.value
+    default_status_code = HTTPStatus.BAD_REQUEST
 
 
 class DocumentNotExistsException(BaseHTTPException):
@@ -49,8 +60,10 @@ class DocumentNotExistsException(BaseHTTPException):
     Document not exists in the database exception
     """
 
-    message = ExceptionMessages.DOCUMENT_DOES_NOT_EXIST.value
-    status_code = HTTPStatus.BAD_REQUEST
+    __slots__ = ()
+
+    default_message = ExceptionMessages.DOCUMENT_DOES_NOT_EXIST.value
+    default_status_code = HTTPStatus.BAD_REQUEST
 
 
 class ForbiddenAccessException(BaseHTTPException):
@@ -58,8 +71,10 @@ class ForbiddenAccessException(BaseHTTPException):
     Forbidden access exception. When user does not have sufficient permission
     """
 
-    message = ExceptionMessages.INSUFFICIENT_PERMISSIONS.value
-    status_code = HTTPStatus.FORBIDDEN
+    __slots__ = ()
+
+    default_message = ExceptionMessages.INSUFFICIENT_PERMISSIONS.value
+    default_status_code = HTTPStatus.FORBIDDEN
 
 
 class IncorrectUsernameOrPasswordException(BaseHTTPException):
@@ -67,8 +82,10 @@ class IncorrectUsernameOrPasswordException(BaseHTTPException):
     Incorrect username or password exception.
     """
 
-    message = ExceptionMessages.INCORRECT_USERNAME_OR_PASSWORD.value
-    status_code = HTTPStatus.UNAUTHORIZED
+    __slots__ = ()
+
+    default_message = ExceptionMessages.INCORRECT_USERNAME_OR_PASSWORD.value
+    default_status_code = HTTPStatus.UNAUTHORIZED
 
 
 class UnauthorizedAccessException(BaseHTTPException):
@@ -76,8 +93,10 @@ class UnauthorizedAccessException(BaseHTTPException):
     Unauthorized access exception
     """
 
-    message = ExceptionMessages.UNAUTHORIZED_ACCESS.value
-    status_code = HTTPStatus.UNAUTHORIZED
+    __slots__ = ()
+
+    default_message = ExceptionMessages.UNAUTHORIZED_ACCESS.value
+    default_status_code = HTTPStatus.UNAUTHORIZED
 
 
 class UserAlreadyExistsException(BaseHTTPException):
@@ -85,5 +104,7 @@ class UserAlreadyExistsException(BaseHTTPException):
     User already exists exception
     """
 
-    message = ExceptionMessages.USER_ALREADY_EXISTS.value
-    status_code = HTTPStatus.BAD_REQUEST
+    __slots__ = ()
+
+    default_message = ExceptionMessages.USER_ALREADY_EXISTS.value
+    default_status_code = HTTPStatus.BAD_REQUEST
@@ -2,27 +2,154 @@
 Helpers Module
 """
 
+import hashlib
+import threading
+import time
+from functools import cache
+from http import HTTPStatus
+
 import jwt
+from cachetools import TTLCache
 from flask import request
 from jwt.exceptions import PyJWTError
 
+from app.enums import ResponseMessages
 from app.exceptions import UnauthorizedAccessException
 from app.settings import JWT_SECRET_KEY, LOGGER, MONGO_CLIENT
 from app.utils import make_response
 
+# Key bytes, algorithm list and decode options prepared once at import;
+# disabling the claim checks this API never issues (aud/iss/nbf) trims
+# interpreter work from every token verification.
+JWT_SECRET: bytes = JWT_SECRET_KEY.encode() if JWT_SECRET_KEY else None
+JWT_ALGORITHMS = ["HS256"]
+JWT_DECODE_OPTIONS = {
+    "verify_signature": True,
+    "verify_exp": True,
+    "verify_aud": False,
+    "verify_iss": False,
+    "verify_nbf": False,
+    "require": ["exp", "username"],
+}
+
+# Authenticated users cached by their raw bearer token, saving a token decode
+# and a database round trip on repeat requests. The short TTL bounds how long
+# a deactivated user can keep an already cached session alive.
+USER_CACHE = TTLCache(maxsize=10_000, ttl=60)
+USER_CACHE_LOCK = threading.Lock()
+
+
+# Token buckets keyed by client address: (tokens, last refill timestamp).
+# A cache lookup plus a little arithmetic, so abusive unauthenticated traffic
+# is rejected in-process before any Redis round trip is spent on it. The TTL
+# bounds memory in long-lived workers; an evicted entry comes back as a full
+# bucket, which is what the refill would have produced after that long anyway.
+_TOKEN_BUCKETS = TTLCache(maxsize=100_000, ttl=300)
+_TOKEN_BUCKETS_LOCK = threading.Lock()
+
+
+def token_bucket(capacity: int = 10, rate: float = 10 / 60):
+    """
+    Decorator factory for an in-process token bucket keyed by client address.
+    Acts as a cheap pre-filter in front of the shared Redis-backed limiter,
+    which stays in place for cross-worker correctness.
+
+    Args:
+        capacity (int, optional): Maximum burst size. Defaults to 10.
+        rate (float, optional): Refill rate in tokens per second. Defaults to 10/60.
+    """
+
+    def decorator(func):
+        """
+        Decorator applying the token bucket to a view function.
+        """
+
+        def wrapper(*args, **kwargs):
+            """
+            Wrapper function enforcing the token bucket.
+            """
+
+            key: str = request.remote_addr or ""
+            now: float = time.monotonic()
+            with _TOKEN_BUCKETS_LOCK:
+                tokens, last_refill = _TOKEN_BUCKETS.get(key, (capacity, now))
+                tokens = min(capacity, tokens + (now - last_refill) * rate)
+                allowed: bool = tokens >= 1
+                _TOKEN_BUCKETS[key] = (tokens - 1 if allowed else tokens, now)
+
+            if not allowed:
+                return make_response(
+                    message=ResponseMessages.TOO_MANY_REQUESTS.value,
+                    status_code=HTTPStatus.TOO_MANY_REQUESTS,
+                )
+            return func(*args, **kwargs)
+
+        return wrapper
 
-def fetch_user(username: str) -> dict:
+    return decorator
+
+
+# Positive projection with only the fields the request path reads, so the
+# lookup moves as few bytes as possible over the wire. The notes array is
+# deliberately absent: reads match own notes by author, so a cached user
+# document cannot hide notes created after it was cached.
+USER_PROJECTION = {"_id": 1, "sharedNotes": 1, "username": 1}
+
+
+@cache
+def _users_collection():
+    """
+    Function to get the users collection handle.
+    Resolved once instead of walking the Flask-PyMongo proxy chain
+    (client, database, collection getattr) on every lookup.
+
+    Returns:
+        Collection: Users collection.
+    """
+
+    return MONGO_CLIENT.db.users
+
+
+def fetch_user(username: str, projection: dict = USER_PROJECTION) -> dict:
     """
     Function to fetch user from the database.
 
     Args:
         username (str): Username.
+        projection (dict, optional): Fields to fetch. Defaults to USER_PROJECTION.
 
     Returns:
         dict: User document if the user exists in the database.
     """
- 
-    return MONGO_CLIENT.db.users.find_one({"isActive": True, "username": username}, {"password": 0})
+
+    return _users_collection().find_one({"isActive": True, "username": username}, projection)
+
+
+def compute_notes_etag(user: dict) -> str:
+    """
+    Function to compute a strong ETag over a user's accessible notes.
+    A single aggregation gathers the count and latest modification time of the
+    owned and shared notes, so the tag changes whenever any of them is
+    created, updated, deleted or newly shared.
+
+    Args:
+        user (dict): User document.
+
+    Returns:
+        str: Hex digest identifying the current state of the user's notes.
+    """
+
+    state: list = list(MONGO_CLIENT.db.notes.aggregate([
+        {
+            "$match": {
+                "$or": [{"author": user["_id"]}, {"_id": {"$in": list(user.get("sharedNotes", []))}}],
+                "isActive": True,
+            },
+        },
+        {"$group": {"_id": None, "count": {"$sum": 1}, "lastModifiedAt": {"$max": "$_lastModifiedAt"}}},
+    ]))
+    digest = hashlib.blake2b(repr((user["_id"], len(user.get("sharedNotes", [])), state)).encode(), digest_size=16)
+    return digest.hexdigest()
 
 
 def authenticate_user(func):
@@ -36,20 +163,29 @@ def authenticate_user(func):
         """
         
         try:
-            token: str = request.headers.get("Authorization")
-            if not token or not token.startswith("Bearer "):
-                raise UnauthorizedAccessException()
-            token = token.split("Bearer ")[1]
-            
-            try:
-                decoded_token: dict = jwt.decode(token, JWT_SECRET_KEY, algorithms=["HS256"])
-            except PyJWTError as error:
-                LOGGER.warning(f"Error occurred while decoding token: {error}")
-                raise UnauthorizedAccessException() from error
-            
-            user: dict = fetch_user(decoded_token["username"])
-            if not user:
+            token: str = request.headers.get("Authorization", "")
+            if not token.startswith("Bearer "):
                 raise UnauthorizedAccessException()
+            token = token[7:]  # len("Bearer ")
+
+            with USER_CACHE_LOCK:
+                user: dict = USER_CACHE.get(token)
+
+            if user is None:
+                try:
+                    decoded_token: dict = jwt.decode(
+                        token, JWT_SECRET, algorithms=JWT_ALGORITHMS, options=JWT_DECODE_OPTIONS
+                    )
+                except PyJWTError as error:
+                    LOGGER.warning(f"Error occurred while decoding token: {error}")
+                    raise UnauthorizedAccessException() from error
+
+                user: dict = fetch_user(decoded_token["username"])
+                if not user:
+                    raise UnauthorizedAccessException()
+
+                with USER_CACHE_LOCK:
+                    USER_CACHE[token] = user
 
             setattr(request, "user", user)
         
@@ -4,20 +4,20 @@ Main Module
 
 from http import HTTPStatus
 
-from flask import Response, request
+import orjson
+from flask import Response, request, stream_with_context
 
 from app.base import BaseAuthView, BaseAuthenticationView, BaseNoteView
 from app.enums import ResponseMessages
-from app.exceptions import (
-    AlreadySharedException,
-    CannotShareNoteToYourselfException,
-    DocumentNotExistsException,
-    ForbiddenAccessException,
-    IncorrectUsernameOrPasswordException,
-    UserAlreadyExistsException,
-)
-from app.notes import CreateNote, DeleteNote, GetNotes, SearchNotes, ShareNote, UpdateNote
+from app.helpers import compute_notes_etag
+from app.notes import BulkCreateNotes, CreateNote, DeleteNote, GetNotes, SearchNotes, ShareNote, UpdateNote
 from app.serializers import (
+    CREATE_NOTE_FAST_VALIDATOR,
+    SEARCH_NOTE_FAST_VALIDATOR,
+    SHARE_NOTE_FAST_VALIDATOR,
+    SIGNIN_FAST_VALIDATOR,
+    SIGNUP_FAST_VALIDATOR,
+    BulkCreateNoteRequestSchema,
     CreateNoteRequestSchema,
     NoteAPIRequestSchema,
     SearchNoteRequestSchema,
@@ -26,65 +26,56 @@ from app.serializers import (
     SignupRequestSchema,
     UpdateNoteRequestSchema,
 )
-from app.settings import LOGGER
 from app.user import CreateUser, LoginUser
-from app.utils import make_response
+
+# Constant frame of the streamed notes-list response; only the documents in
+# between are serialized per request.
+_NOTES_STREAM_PREFIX = (
+    b'{"message":"' + ResponseMessages.NOTE_FETCHED_SUCCESSFULLY.value.encode() + b'","data":{"notes":['
+)
+_NOTES_STREAM_SUFFIX = b"]}}"
+
+
+def _stream_notes(cursor):
+    """
+    Generator yielding the notes-list response one document at a time, so peak
+    memory stays bounded by a single cursor batch instead of the full result.
+
+    Args:
+        cursor (Cursor): Projected cursor over the user's notes.
+
+    Yields:
+        bytes: Chunks of the JSON response body.
+    """
+
+    yield _NOTES_STREAM_PREFIX
+    separator: bytes = b""
+    for note in cursor:
+        yield separator + orjson.dumps(note, default=str)
+        separator = b","
+    yield _NOTES_STREAM_SUFFIX
 
 
 class SignupView(BaseAuthView):
     """
     View class for user signup
     """
-    
+
+    fast_validator = staticmethod(SIGNUP_FAST_VALIDATOR)
     payload_schema = SignupRequestSchema
     processor_class = CreateUser
     success_message = ResponseMessages.USER_CREATED_SUCCESSFULLY.value
-    
-    def post(self) -> tuple[Response, HTTPStatus]:
-        """
-        This endpoint handles the request for user signup.
-        1. Validates incoming request data.
-        2. Checks if the user with the given username already exists.
-        3. Hash the password.
-        3. Creates new user.
-        
-        Returns:
-            tuple[Response, HTTPStatus]: Response, status code.
-        """
-        
-        try:
-            return super().post()
-        except UserAlreadyExistsException as error:
-            LOGGER.warning(f"Error occurred during signup: {error.message}")
-            return make_response(message=error.message, status_code=error.status_code)
 
 
 class SigninView(BaseAuthView):
     """
     View class for user signin
     """
-    
+
+    fast_validator = staticmethod(SIGNIN_FAST_VALIDATOR)
     payload_schema = SigninRequestSchema
     processor_class = LoginUser
     success_message = ResponseMessages.USER_LOGGED_IN_SUCCESSFULLY.value
-    
-    def post(self) -> tuple[Response, HTTPStatus]:
-        """
-        This endpoint handles the request for user signin.
-        1. Validates incoming request data.
-        2. Checks if the user with the given username exists.
-        3. Verifies the password.
-        3. Generates and returns a jwt token.
-        
-        Returns:
-            tuple[Response, HTTPStatus]: Response, status code
-        """
-        
-        try:
-            return super().post()
-        except IncorrectUsernameOrPasswordException as error:
-            LOGGER.warning(f"Error occurred during signin: {error.message}")
-            return make_response(message=error.message, status_code=error.status_code)
 
 
 class CreateNoteView(BaseNoteView):
@@ -92,11 +83,22 @@ class CreateNoteView(BaseNoteView):
     View class for creating a new note
     """
 
+    fast_validator = staticmethod(CREATE_NOTE_FAST_VALIDATOR)
     payload_schema = CreateNoteRequestSchema
     processor_class = CreateNote
     success_message = ResponseMessages.NOTE_CREATED_SUCCESSFULLY.value
 
 
+class BulkCreateNotesView(BaseNoteView):
+    """
+    View class for creating multiple notes in one request
+    """
+
+    payload_schema = BulkCreateNoteRequestSchema
+    processor_class = BulkCreateNotes
+    success_message = ResponseMessages.NOTES_CREATED_SUCCESSFULLY.value
+
+
 class GetNotesView(BaseNoteView):
     """
     View class to get notes of a user
@@ -105,11 +107,13 @@ class GetNotesView(BaseNoteView):
     payload_schema = NoteAPIRequestSchema
     processor_class = GetNotes
     success_message = ResponseMessages.NOTE_FETCHED_SUCCESSFULLY.value
-    
+
     def get(self, note_id: str = None) -> tuple[Response, HTTPStatus]:
         """
-        Get method for fetching notes of a user.
-        If note_id is present then fetch only that note otherwise fetch all the notes.
+        Get method with conditional-request support.
+        A strong ETag derived from the user's accessible notes lets clients
+        revalidate with If-None-Match and skip the fetch and serialization
+        when nothing changed.
 
         Args:
             note_id (str, optional): Note id. Defaults to None.
@@ -118,11 +122,22 @@ class GetNotesView(BaseNoteView):
             tuple[Response, HTTPStatus]: Response, status code.
         """
 
-        try:
-            return super().get(note_id)
-        except (DocumentNotExistsException, ForbiddenAccessException) as error:
-            LOGGER.warning(f"Error occurred while fetching note(s): {error}")
-            return make_response(message=error.message, status_code=error.status_code)
+        etag: str = compute_notes_etag(request.user)
+        if etag in request.if_none_match:
+            return Response(status=HTTPStatus.NOT_MODIFIED), HTTPStatus.NOT_MODIFIED
+
+        if note_id is None:
+            cursor = GetNotes({}, request.user).notes_cursor()
+            response = Response(stream_with_context(_stream_notes(cursor)), mimetype="application/json")
+            status_code = HTTPStatus.OK
+        else:
+            response, status_code = super().get(note_id)
+
+        if status_code == HTTPStatus.OK:
+            response.set_etag(etag)
+            response.cache_control.max_age = 30
+            response.cache_control.private = True
+        return response, status_code
 
 
 class DeleteNoteView(BaseNoteView):
@@ -133,23 +148,6 @@ class DeleteNoteView(BaseNoteView):
     payload_schema = NoteAPIRequestSchema
     processor_class = DeleteNote
     success_message = ResponseMessages.NOTE_DELETED_SUCCESSFULLY.value
-    
-    def delete(self, note_id: str) -> tuple[Response, HTTPStatus]:
-        """
-        Delete method for deleting a note.
-
-        Args:
-            note_id (str): Note id.
-
-        Returns:
-            tuple[Response, HTTPStatus]: Response, status code.
-        """
-        
-        try:
-            return super().delete(note_id)
-        except (DocumentNotExistsException, ForbiddenAccessException) as error:
-            LOGGER.warning(f"Error occurred while deleting note: {error}")
-            return make_response(message=error.message, status_code=error.status_code)
 
 
 class UpdateNoteView(BaseNoteView):
@@ -160,23 +158,6 @@ class UpdateNoteView(BaseNoteView):
     payload_schema = UpdateNoteRequestSchema
     processor_class = UpdateNote
     success_message = ResponseMessages.NOTE_UPDATED_SUCCESSFULLY.value
-    
-    def put(self, note_id: str) -> tuple[Response, HTTPStatus]:
-        """
-        Put method for updating a note.
-
-        Args:
-            note_id (str): Note id.
-
-        Returns:
-            tuple[Response, HTTPStatus]: Response, status code.
-        """
-        
-        try:
-            return super().put(note_id)
-        except (DocumentNotExistsException, ForbiddenAccessException) as error:
-            LOGGER.warning(f"Error occurred while updating note: {error}")
-            return make_response(message=error.message, status_code=error.status_code)
 
 
 class ShareNoteView(BaseNoteView):
@@ -184,42 +165,22 @@ class ShareNoteView(BaseNoteView):
     View class to share a note to another user
     """
 
+    fast_validator = staticmethod(SHARE_NOTE_FAST_VALIDATOR)
     payload_schema = ShareNoteRequestSchema
     processor_class = ShareNote
     success_message = ResponseMessages.NOTE_SHARED_SUCCESSFULLY.value
-    
-    def post(self, note_id: str) -> tuple[Response, HTTPStatus]:
-        """
-        Post method for sharing note with another user.
-
-        Args:
-            note_id (str): Note id.
-
-        Returns:
-            tuple[Response, HTTPStatus]: Response, status code.
-        """
-        
-        try:
-            return super().post(note_id)
-        except (
-            AlreadySharedException,
-            CannotShareNoteToYourselfException,
-            DocumentNotExistsException,
-            ForbiddenAccessException,
-        ) as error:
-            LOGGER.warning(f"Error occurred while sharing note to another user: {error}")
-            return make_response(message=error.message, status_code=error.status_code)
 
 
 class SearchNotesView(BaseAuthenticationView):
     """
     View class to search for notes based on keyword
     """
-    
+
+    fast_validator = staticmethod(SEARCH_NOTE_FAST_VALIDATOR)
     payload_schema = SearchNoteRequestSchema
     processor_class = SearchNotes
     success_message = ResponseMessages.NOTE_FETCHED_SUCCESSFULLY.value
-    
+
     def get(self) -> tuple[Response, HTTPStatus]:
         """
         Get method for searching notes.
@@ -2,10 +2,10 @@
 Notes Module
 """
 
-from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from bson import ObjectId
-from pymongo.results import InsertOneResult
+from pymongo.results import UpdateResult
 
 from app.exceptions import (
     AlreadySharedException,
@@ -13,17 +13,56 @@ from app.exceptions import (
     DocumentNotExistsException,
     ForbiddenAccessException,
 )
-from app.helpers import fetch_user
-from app.serializers import CreateNoteDocumentSchema, NotesSchema
 from app.settings import MONGO_CLIENT
 from app.utils import get_current_datetime
 
+# Only the fields the read responses emit; keeps the bytes fetched per note
+# (and the BSON decode work) to what the response actually needs. _createdAt
+# is no longer stored - the _id embeds the creation time, so the projection
+# reconstructs it server-side to keep the response shape unchanged.
+NOTE_PROJECTION = {
+    "_createdAt": {"$toDate": "$_id"},
+    "_lastModifiedAt": 1,
+    "author": 1,
+    "body": 1,
+    "title": 1,
+}
+
+# Cursor batch sized to typical per-user note counts, so results come back in
+# one rightsized batch instead of the default 101-document first batch.
+NOTE_BATCH_SIZE = 50
+
+# Search responses are capped server-side; relevance sorting makes the first
+# page the best matches anyway.
+SEARCH_RESULT_LIMIT = 50
+
+@lru_cache(maxsize=4096)
+def _oid(note_id: str) -> ObjectId:
+    """
+    Function to parse a note id string into an ObjectId.
+    Cached across requests, so repeated operations on the same hot notes skip
+    the hex validation and decode entirely.
+
+    Args:
+        note_id (str): Note id.
+
+    Returns:
+        ObjectId: Parsed ObjectId.
+    """
+
+    return ObjectId(note_id)
 
-class Notes(ABC):
+
+class Notes:
     """
     User base class
     """
-    
+
+    # Plain class instead of ABC: processors are constructed per request, and
+    # ABCMeta adds abstract-method bookkeeping to every instantiation. Slots
+    # skip the per-instance __dict__ allocation as well.
+    __slots__ = ("request_data", "user", "shared_note_ids", "_note_oid")
+
     def __init__(self, validated_data: dict, user: dict) -> None:
         """
         Initialization function.
@@ -35,19 +74,43 @@ class Notes(ABC):
 
         self.request_data: dict = validated_data
         self.user: dict = user
-        
-    def fetch_note(self) -> dict:
+        # Shared notes as a set so access checks are O(1) instead of scanning
+        # the ObjectId list per note.
+        shared_notes = user.get("sharedNotes", [])
+        self.shared_note_ids: set = shared_notes if isinstance(shared_notes, set) else set(shared_notes)
+        self._note_oid: ObjectId = None
+
+
+    def note_object_id(self) -> ObjectId:
+        """
+        Function to get the note id as an ObjectId.
+        Parsed once per request and memoized on the processor (never on the
+        request data, where a client-supplied key could masquerade as the
+        parsed value), so repeat callers skip the hex decode.
+
+        Returns:
+            ObjectId: Note ObjectId.
+        """
+
+        if self._note_oid is None:
+            self._note_oid = _oid(self.request_data["note_id"])
+        return self._note_oid
+
+    def fetch_note(self, projection: dict = None) -> dict:
         """
         Funtion to fetch note.
 
+        Args:
+            projection (dict, optional): Fields to fetch. Defaults to None (all fields).
+
         Raises:
             DocumentNotExistsException: When the note document does not exist.
 
         Returns:
             dict: Note document.
         """
-        
-        note: dict = MONGO_CLIENT.db.notes.find_one({"_id": ObjectId(self.request_data["note_id"]), "isActive": True})
+
+        note: dict = MONGO_CLIENT.db.notes.find_one({"_id": self.note_object_id(), "isActive": True}, projection)
         if not note:
             raise DocumentNotExistsException()
         return note
@@ -63,7 +126,7 @@ class Notes(ABC):
             ForbiddenAccessException: When user does not have read access of the note.
         """
         
-        if  (self.user["_id"] != note["author"]) and (note["_id"] not in self.user["sharedNotes"]):
+        if  (self.user["_id"] != note["author"]) and (note["_id"] not in self.shared_note_ids):
             raise ForbiddenAccessException()
         
     def has_write_access(self, note: dict) -> None:
@@ -79,53 +142,163 @@ class Notes(ABC):
         
         if  self.user["_id"] != note["author"]:
             raise ForbiddenAccessException()
-    
-    @abstractmethod
+
+    def raise_write_failure(self) -> None:
+        """
+        Function to raise the right exception after an author-filtered write
+        matched no document. Runs a cheap projected lookup to distinguish a
+        missing note from a foreign one, keeping the extra round trip off the
+        success path.
+
+        Raises:
+            DocumentNotExistsException: When the note document does not exist.
+            ForbiddenAccessException: When user does not have write access of the note.
+        """
+
+        note: dict = MONGO_CLIENT.db.notes.find_one(
+            {"_id": self.note_object_id(), "isActive": True}, {"author": 1}
+        )
+        if not note:
+            raise DocumentNotExistsException()
+        raise ForbiddenAccessException()
+
     def process(self) -> dict:
         """
         Driver Function for processing the request
         """
 
+        raise NotImplementedError
+
 
 class CreateNote(Notes):
     """
     Class for creating a new note
     """
+
+    __slots__ = ()
     
     def process(self) -> dict:
         """
         Function for creating new note.
-        1. Prepare note data to set on the database.
-        2. Create new note document.
-        3. Append the note object id in the notes field in user document.
+        1. Prepare note data with a client-side generated note id, so the user
+           update does not wait on the insert's returned id.
+        2. Create the note document and append its id to the notes field in
+           the user document inside one retryable transaction callback.
 
         Returns:
             dict: Containing new note id.
         """
-        
-        note_data: dict = CreateNoteDocumentSchema().load({**self.request_data, "author": str(self.user["_id"])})
 
+        note_id: ObjectId = ObjectId()
+        now = get_current_datetime()
+        # The document shape is fixed and the payload already validated, so a
+        # dict literal replaces the marshmallow field walk of the old
+        # CreateNoteDocumentSchema.load.
+        note_data: dict = {
+            "_id": note_id,
+            "_lastModifiedAt": now,
+            "author": self.user["_id"],
+            "body": self.request_data["body"],
+            "title": self.request_data["title"],
+            "isActive": True,
+        }
+
+        def callback(session) -> None:
+            MONGO_CLIENT.db.notes.insert_one(note_data, session=session)
+            MONGO_CLIENT.db.users.update_one(
+                {"_id": self.user["_id"]},
+                {
+                    "$push": {"notes": note_id},
+                    "$set": {"_lastModifiedAt": get_current_datetime()},
+                },
+                session=session,
+            )
+
+        # with_transaction handles commit plus transient-error retries, unlike
+        # the manual start/commit pair it replaces.
         with MONGO_CLIENT.cx.start_session() as session:
-            with session.start_transaction():
-                result: InsertOneResult = MONGO_CLIENT.db.notes.insert_one(note_data, session=session)
-                note_id: str = result.inserted_id
-                MONGO_CLIENT.db.users.update_one(
-                    {"_id": self.user["_id"]},
-                    {
-                        "$push": {"notes": note_id},
-                        "$set": {"_lastModifiedAt": get_current_datetime()},
-                    },
-                    session=session,
-                )
-                session.commit_transaction()
-                return {"note_id": str(note_id)}
+            session.with_transaction(callback)
+        return {"note_id": str(note_id)}
+
+
+class BulkCreateNotes(Notes):
+    """
+    Class for creating multiple notes in one request
+    """
+
+    __slots__ = ()
+
+    def process(self) -> dict:
+        """
+        Function for creating notes in bulk.
+        1. Build all note documents with client-side generated ids.
+        2. Insert them with one unordered insert_many and link every id to
+           the user document in a single $push, inside one retryable
+           transaction callback.
+
+        Returns:
+            dict: Containing the new note ids.
+        """
+
+        now = get_current_datetime()
+        note_data: list[dict] = [
+            {
+                "_id": ObjectId(),
+                "_lastModifiedAt": now,
+                "author": self.user["_id"],
+                "body": note["body"],
+                "title": note["title"],
+                "isActive": True,
+            }
+            for note in self.request_data["notes"]
+        ]
+        note_ids: list[ObjectId] = [note["_id"] for note in note_data]
+
+        def callback(session) -> None:
+            MONGO_CLIENT.db.notes.insert_many(note_data, ordered=False, session=session)
+            MONGO_CLIENT.db.users.update_one(
+                {"_id": self.user["_id"]},
+                {
+                    "$push": {"notes": {"$each": note_ids}},
+                    "$set": {"_lastModifiedAt": now},
+                },
+                session=session,
+            )
+
+        with MONGO_CLIENT.cx.start_session() as session:
+            session.with_transaction(callback)
+        return {"note_ids": [str(note_id) for note_id in note_ids]}
 
 
 class GetNotes(Notes):
     """
     Class for fetching notes
     """
+
+    __slots__ = ()
     
+    def notes_cursor(self):
+        """
+        Function to get a projected cursor over all notes the user can read,
+        so callers can stream documents batch by batch instead of holding the
+        full result set in memory. Own notes are matched by author rather
+        than the user document's notes array: the authentication cache may
+        serve a user document that is up to a minute old, and an author match
+        keeps just-created notes visible (and the result consistent with the
+        ETag, which aggregates over the same filter).
+
+        Returns:
+            Cursor: Projected cursor over the user's own and shared notes.
+        """
+
+        return MONGO_CLIENT.db.notes.find(
+            {
+                "$or": [{"author": self.user["_id"]}, {"_id": {"$in": list(self.shared_note_ids)}}],
+                "isActive": True,
+            },
+            NOTE_PROJECTION,
+        ).batch_size(NOTE_BATCH_SIZE)
+
     def process(self) -> dict:
         """
         Function for fetching note(s).
@@ -133,7 +306,7 @@ class GetNotes(Notes):
             1.1 Check if the note exists.
             1.2 Check whether the user has access to the note.
         2. If note_id is not present then fetch all the notes of the user.
-        
+
         Raises:
             DocumentNotExistsException: When the note document does not exist.
             ForbiddenAccessException: When user does not have read access of the note.
@@ -143,109 +316,120 @@ class GetNotes(Notes):
         """
 
         if self.request_data.get("note_id"):
-            notes: list[dict] = [self.fetch_note()]
-            self.has_read_access(notes[0])
+            note: dict = self.fetch_note(NOTE_PROJECTION)
+            self.has_read_access(note)
+            notes: list[dict] = [note]
         else:
-            notes: list[dict] = list(MONGO_CLIENT.db.notes.find(
-                {"_id": {"$in": [*self.user["notes"], *self.user["sharedNotes"]]}, "isActive": True},
-            ))
-        return NotesSchema().dump({"notes": notes})
+            notes: list[dict] = list(self.notes_cursor())
+        # Projected documents go straight to the orjson response provider, so
+        # no per-field marshmallow dump runs on the read path.
+        return {"notes": notes}
 
 
 class DeleteNote(Notes):
     """
     Class for deleting a note
     """
+
+    __slots__ = ()
     
     def process(self):
         """
         Function to soft delete a note.
-        1. Check if the note exists.
-        2. Check whether the user has access to the note.
-        3. Soft delete the note by setting isActive to False.
+        1. Soft delete the note by setting isActive to False; the update filter
+           enforces existence and authorship in the same round trip.
+        2. If nothing matched, raise the appropriate exception.
 
         Raises:
             DocumentNotExistsException: When the note document does not exist.
             ForbiddenAccessException: When user does not have write access of the note.
         """
 
-        with MONGO_CLIENT.cx.start_session() as session:
-            with session.start_transaction():
-                note : dict = self.fetch_note()
-                self.has_write_access(note)
-                MONGO_CLIENT.db.notes.update_one(
-                    {"_id": note["_id"], "isActive": True},
-                    {"$set": {"isActive": False, "_lastModifiedAt": get_current_datetime()}}
-                )
-                session.commit_transaction()
+        # Pipeline-form update so _lastModifiedAt comes from the server clock
+        # ($$NOW) instead of a per-call Python timestamp.
+        result: UpdateResult = MONGO_CLIENT.db.notes.update_one(
+            {"_id": self.note_object_id(), "author": self.user["_id"], "isActive": True},
+            [{"$set": {"isActive": False, "_lastModifiedAt": "$$NOW"}}],
+        )
+        if result.matched_count == 0:
+            self.raise_write_failure()
 
 
 class UpdateNote(Notes):
     """
     Class for updating a note
     """
+
+    __slots__ = ()
     
     def process(self):
         """
         Function to update a note.
-        1. Check if the note exists.
-        2. Check whether the user has access to the note.
-        3. Update the note.
-        
+        1. Update the note; the update filter enforces existence and authorship
+           in the same round trip.
+        2. If nothing matched, raise the appropriate exception.
+
         Raises:
             DocumentNotExistsException: When the note document does not exist.
             ForbiddenAccessException: When user does not have write access of the note.
         """
 
-        with MONGO_CLIENT.cx.start_session() as session:
-            with session.start_transaction():
-                note : dict = self.fetch_note()
-                self.has_write_access(note)
-                data_to_update: dict = {key: value for key, value in self.request_data.items() if key != "note_id"}
-                MONGO_CLIENT.db.notes.update_one(
-                    {"_id": note["_id"], "isActive": True},
-                    {
-                        "$set": {
-                            **data_to_update,
-                            "_lastModifiedAt": get_current_datetime(),
-                        },
-                    },
-                )
-                session.commit_transaction()
+        # $literal keeps the user-supplied strings inert inside the
+        # pipeline-form update, where bare values are aggregation expressions.
+        data_to_update: dict = {
+            key: {"$literal": value} for key, value in self.request_data.items() if key != "note_id"
+        }
+        result: UpdateResult = MONGO_CLIENT.db.notes.update_one(
+            {"_id": self.note_object_id(), "author": self.user["_id"], "isActive": True},
+            [{"$set": {**data_to_update, "_lastModifiedAt": "$$NOW"}}],
+        )
+        if result.matched_count == 0:
+            self.raise_write_failure()
 
 
 class ShareNote(Notes):
     """
     Class for sharing a note
     """
+
+    __slots__ = ()
     
-    def check_if_note_can_be_shared(self, note: dict, user_to_share: dict) -> None:
+    def raise_share_failure(self, note: dict) -> None:
         """
-        Function to check if a note can be shared.
+        Function to raise the right exception after the guarded share update
+        matched no document. Runs a projected lookup to tell a missing user,
+        a self-share and an already shared note apart, keeping the extra round
+        trip off the success path.
 
         Args:
             note (dict): Note document.
-            user_to_share (dict): User document to whom the note is to be shared.
 
         Raises:
+            DocumentNotExistsException: When the user document does not exist.
             CannotShareNoteToYourselfException: When the user is trying to share a note to himself.
             AlreadySharedException: When the note is already shared with the user.
         """
 
+        user_to_share: dict = MONGO_CLIENT.db.users.find_one(
+            {"username": self.request_data["share_with"], "isActive": True}, {"_id": 1}
+        )
+        if not user_to_share:
+            raise DocumentNotExistsException(
+                message="The user you are trying to share the note with doesn't exist."
+            )
         if user_to_share["_id"] == note["author"]:
             raise CannotShareNoteToYourselfException()
-
-        if note["_id"] in user_to_share["sharedNotes"]:
-            raise AlreadySharedException()
+        raise AlreadySharedException()
 
     def process(self):
         """
         Function to share a note with another user.
-        1. Check if the note exists.
-        2. Check whether the user has write access to the note.
-        3. Check if user is trying to share the note to himself.
-        4. Check if the note is already shared.
-        5. Share the note with another user.
+        1. Check if the note exists and whether the user has write access to it.
+        2. Share the note in a single update whose filter also rejects a
+           self-share and an already shared note, so both checks run
+           server-side without fetching the target user's (potentially large)
+           sharedNotes array.
+        3. If nothing matched, raise the appropriate exception.
 
         Raises:
             DocumentNotExistsException: When the note or the user document does not exist.
@@ -253,25 +437,23 @@ class ShareNote(Notes):
             CannotShareNoteToYourselfException: When the user is trying to share a note to himself.
             AlreadySharedException: When the note is already shared with the user.
         """
-        
-        with MONGO_CLIENT.cx.start_session() as session:
-            with session.start_transaction():
-                note : dict = self.fetch_note()
-                self.has_write_access(note)
-                user_to_share: dict = fetch_user(self.request_data["share_with"])
-                if not user_to_share:
-                    raise DocumentNotExistsException(
-                        message="The user you are trying to share the note with doesn't exist."
-                    )
-                self.check_if_note_can_be_shared(note, user_to_share)
-                MONGO_CLIENT.db.users.update_one(
-                    {"_id": user_to_share["_id"], "isActive": True},
-                    {
-                        "$push": {"sharedNotes": note["_id"]},
-                        "$set": {"_lastModifiedAt": get_current_datetime()},
-                    }
-                )
-                session.commit_transaction()
+
+        note: dict = self.fetch_note({"author": 1})
+        self.has_write_access(note)
+        result: UpdateResult = MONGO_CLIENT.db.users.update_one(
+            {
+                "username": self.request_data["share_with"],
+                "isActive": True,
+                "_id": {"$ne": note["author"]},
+                "sharedNotes": {"$ne": note["_id"]},
+            },
+            {
+                "$addToSet": {"sharedNotes": note["_id"]},
+                "$set": {"_lastModifiedAt": get_current_datetime()},
+            },
+        )
+        if result.matched_count == 0:
+            self.raise_share_failure(note)
 
 
 class SearchNotes(Notes):
@@ -279,6 +461,8 @@ class SearchNotes(Notes):
     Class for searching notes
     """
 
+    __slots__ = ()
+
     def process(self) -> dict:
         """
         Function to search notes based on keywords.
@@ -287,7 +471,14 @@ class SearchNotes(Notes):
             dict: Notes whose title or body contain the keywords.
         """
 
+        # Filtering, relevance sorting, limiting and projection all run
+        # server-side in one pipeline, so only the best matches cross the wire.
         notes = list(
-            MONGO_CLIENT.db.notes.find({"author": self.user["_id"], "$text": {"$search": self.request_data["q"]}})
+            MONGO_CLIENT.db.notes.aggregate([
+                {"$match": {"author": self.user["_id"], "$text": {"$search": self.request_data["q"]}}},
+                {"$sort": {"score": {"$meta": "textScore"}}},
+                {"$limit": SEARCH_RESULT_LIMIT},
+                {"$project": NOTE_PROJECTION},
+            ])
         )
-        return NotesSchema().dump({"notes": notes})
+        return {"notes": notes}
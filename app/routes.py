@@ -2,9 +2,12 @@
 Routes Module
 """
 
-from flask import Blueprint, Flask
+from http import HTTPStatus
+
+from flask import Blueprint, Flask, Response
 
 from app.main import (
+    BulkCreateNotesView,
     CreateNoteView,
     DeleteNoteView,
     GetNotesView,
@@ -14,11 +17,27 @@ from app.main import (
     SignupView,
     UpdateNoteView,
 )
+from app.settings import LIMITER
+from app.utils import make_response
 
 api_bp = Blueprint("api_bp", __name__, url_prefix="/api")
 auth_bp = Blueprint("auth_bp", __name__, url_prefix="/auth")
 notes_bp = Blueprint("notes_bp", __name__, url_prefix="/notes")
 
+
+@LIMITER.exempt
+def health_check() -> tuple[Response, HTTPStatus]:
+    """
+    Health check endpoint for probes. Exempt from rate limiting so liveness
+    checks never cost a limiter storage round trip.
+
+    Returns:
+        tuple[Response, HTTPStatus]: Response, status code.
+    """
+
+    return make_response(message="OK")
+
+
 def register_routes(app: Flask) -> None:
     """
     Function to register routes
@@ -27,14 +46,20 @@ def register_routes(app: Flask) -> None:
         app (Flask): Flask app
     """
     
+    app.add_url_rule("/health", view_func=health_check, methods=["GET"])
+
     # Auth routes
     auth_bp.add_url_rule("/signup", view_func=SignupView.as_view("signup_view"), methods=["POST"])
     auth_bp.add_url_rule("/signin", view_func=SigninView.as_view("signin_view"), methods=["POST"])
     
     # Notes routes
     notes_bp.add_url_rule("/", view_func=CreateNoteView.as_view("create_note"), methods=["POST"])
-    notes_bp.add_url_rule("/", view_func=GetNotesView.as_view("get_notes"), methods=["GET"])
-    notes_bp.add_url_rule("/<note_id>", view_func=GetNotesView.as_view("get_note"), methods=["GET"])
+    notes_bp.add_url_rule("/bulk", view_func=BulkCreateNotesView.as_view("bulk_create_notes"), methods=["POST"])
+    # One view function serves both GET rules; the bare rule defaults note_id
+    # to None instead of registering a second view.
+    get_notes_view = GetNotesView.as_view("get_notes")
+    notes_bp.add_url_rule("/", defaults={"note_id": None}, view_func=get_notes_view, methods=["GET"])
+    notes_bp.add_url_rule("/<note_id>", view_func=get_notes_view, methods=["GET"])
     notes_bp.add_url_rule("/<note_id>", view_func=DeleteNoteView.as_view("delete_note"), methods=["DELETE"])
     notes_bp.add_url_rule("/<note_id>", view_func=UpdateNoteView.as_view("update_note"), methods=["PUT"])
     notes_bp.add_url_rule("/<note_id>/share", view_func=ShareNoteView.as_view("share_note"), methods=["POST"])
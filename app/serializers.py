@@ -2,38 +2,75 @@
 Serializers Module
 """
 
-from bson import ObjectId
+import fastjsonschema
 
-from marshmallow import EXCLUDE, Schema, ValidationError, fields, post_load, pre_load, validate, validates_schema
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, pre_load, validate, validates_schema
 
-from app.constants import REGEX_NAME, REGEX_PASSWORD
+from app.constants import NAME_PATTERN, PASSWORD_PATTERN, REGEX_NAME, REGEX_PASSWORD
 from app.enums import ErrorMessages
-from app.utils import get_current_datetime
 
+# Messages for fast validator failures, keyed by (field, failed json schema rule).
+# Kept in sync with the messages raised by the marshmallow request schemas.
+FAST_VALIDATION_MESSAGES = {
+    ("first_name", "pattern"): ErrorMessages.INVALID_NAME.value,
+    ("last_name", "pattern"): ErrorMessages.INVALID_NAME.value,
+    ("password", "minLength"): ErrorMessages.SHORT_PASSWORD.value,
+    ("password", "pattern"): ErrorMessages.INVALID_PASSWORD.value,
+    ("share_with", "format"): "Not a valid email address.",
+    ("username", "format"): "Not a valid email address.",
+}
 
-class ObjectIdField(fields.Field):
+
+def format_fast_validation_error(error: fastjsonschema.JsonSchemaValueException, data: dict) -> dict:
     """
-    ObjectId field
+    Function to convert a fastjsonschema exception into marshmallow style error messages.
+
+    Args:
+        error (fastjsonschema.JsonSchemaValueException): Validation exception.
+        data (dict): Request data that failed validation.
+
+    Returns:
+        dict: Error messages keyed by field name.
     """
 
-    def _deserialize(self, value: str, attr, obj, **kwargs) -> ObjectId:
-        """
-        Function to deserialize _id field of mongodb documents.
+    if error.rule == "required":
+        missing_fields: list = [field for field in error.rule_definition if field not in data]
+        return {field: ["Missing data for required field."] for field in missing_fields}
 
-        Args:
-            value (str): Document id.
+    if len(error.path) < 2:
+        return {"_schema": [error.message]}
 
-        Returns:
-            ObjectId: ObjectId.
-        """
+    field: str = error.path[-1]
+    return {field: [FAST_VALIDATION_MESSAGES.get((field, error.rule), error.message)]}
+
+
+def compile_fast_validator(json_schema: dict):
+    """
+    Function to compile a JSON schema into a fast payload validator.
+    fastjsonschema generates straight-line python code for the schema, which is
+    considerably faster than the generic marshmallow field walk. Failures are
+    re-raised as marshmallow ValidationError so the error response format of the
+    views stays unchanged, and unknown keys are dropped from the result so the
+    fast path keeps the EXCLUDE semantics of the marshmallow schemas.
+
+    Args:
+        json_schema (dict): JSON schema to compile.
+
+    Returns:
+        Callable: Validator function accepting the request data.
+    """
+
+    compiled = fastjsonschema.compile(json_schema)
+    known_fields = tuple(json_schema["properties"])
 
+    def validate_payload(data: dict) -> dict:
         try:
-            return ObjectId(value)
-        except Exception as error:
-            raise fields.ValidationError(f"Invalid ObjectId: {value}")
-        
-    def _serialize(self, value: ObjectId, attr, obj, **kwargs) -> str:
-        return str(value)
+            compiled(data)
+        except fastjsonschema.JsonSchemaValueException as error:
+            raise ValidationError(format_fast_validation_error(error, data)) from error
+        return {field: data[field] for field in known_fields if field in data}
+
+    return validate_payload
 
 
 class BaseSchema(Schema):
@@ -47,31 +84,6 @@ class BaseSchema(Schema):
         """
 
         unknown = EXCLUDE
-        
-
-class BaseMongoSchema(BaseSchema):
-    """
-    Base mongo schema
-    """
-    
-    _createdAt = fields.DateTime()
-    _lastModifiedAt = fields.DateTime()
-    isActive = fields.Boolean(load_default=True)
-    
-    @post_load
-    def transform(self, data: dict, **_) -> dict:
-        """
-        Add _createdAt and _lastModifiedAt fields in the data.
-
-        Args:
-            data (dict): Validated data.
-
-        Returns:
-            dict: Validated data with _createdAt and _lastModifiedAt fields.
-        """
-        
-        data["_createdAt"] = data["_lastModifiedAt"] = get_current_datetime()
-        return data
 
 
 class BaseAuthRequestSchema(BaseSchema):
@@ -83,7 +95,7 @@ class BaseAuthRequestSchema(BaseSchema):
         required=True,
         validate=[
             validate.Length(min=6, error=ErrorMessages.SHORT_PASSWORD.value),
-            validate.Regexp(REGEX_PASSWORD, error=ErrorMessages.INVALID_PASSWORD.value),
+            validate.Regexp(PASSWORD_PATTERN, error=ErrorMessages.INVALID_PASSWORD.value),
         ],
     )
     username = fields.Email(required=True)
@@ -102,25 +114,72 @@ class SignupRequestSchema(BaseAuthRequestSchema):
     
     first_name = fields.String(
         required=True,
-        validate=validate.Regexp(REGEX_NAME, error=ErrorMessages.INVALID_NAME.value),
+        validate=validate.Regexp(NAME_PATTERN, error=ErrorMessages.INVALID_NAME.value),
     )
     last_name = fields.String(
         required=True,
-        validate=validate.Regexp(REGEX_NAME, error=ErrorMessages.INVALID_NAME.value),
+        validate=validate.Regexp(NAME_PATTERN, error=ErrorMessages.INVALID_NAME.value),
     )
 
 
-class CreateUserDocumentSchema(BaseMongoSchema):
-    """
-    Create user document schema
-    """
-    
-    firstName = fields.String(required=True, data_key="first_name")
-    lastName = fields.String(required=True, data_key="last_name")
-    password = fields.String(required=True)
-    username = fields.String(required=True)
-    notes = fields.List(ObjectIdField(), load_default=[])
-    sharedNotes = fields.List(ObjectIdField(), load_default=[])
+# fastjsonschema rewrites every un-escaped "$" (even inside []-sets) to "\Z",
+# so the literal dollar inside the character class must be escaped for it.
+FAST_REGEX_PASSWORD = REGEX_PASSWORD.replace("#$%", r"#\$%")
+
+SIGNIN_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "password": {"type": "string", "minLength": 6, "pattern": FAST_REGEX_PASSWORD},
+        "username": {"type": "string", "format": "email"},
+    },
+    "required": ["password", "username"],
+}
+
+SIGNUP_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        **SIGNIN_JSON_SCHEMA["properties"],
+        "first_name": {"type": "string", "pattern": REGEX_NAME},
+        "last_name": {"type": "string", "pattern": REGEX_NAME},
+    },
+    "required": ["first_name", "last_name", "password", "username"],
+}
+
+CREATE_NOTE_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "body": {"type": "string"},
+        "title": {"type": "string"},
+    },
+    "required": ["body", "title"],
+}
+
+SEARCH_NOTE_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "q": {"type": "string"},
+    },
+    "required": ["q"],
+}
+
+SHARE_NOTE_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "note_id": {"type": "string"},
+        "share_with": {"type": "string", "format": "email"},
+    },
+    "required": ["share_with"],
+}
+
+CREATE_NOTE_FAST_VALIDATOR = compile_fast_validator(CREATE_NOTE_JSON_SCHEMA)
+
+SEARCH_NOTE_FAST_VALIDATOR = compile_fast_validator(SEARCH_NOTE_JSON_SCHEMA)
+
+SHARE_NOTE_FAST_VALIDATOR = compile_fast_validator(SHARE_NOTE_JSON_SCHEMA)
+
+SIGNIN_FAST_VALIDATOR = compile_fast_validator(SIGNIN_JSON_SCHEMA)
+
+SIGNUP_FAST_VALIDATOR = compile_fast_validator(SIGNUP_JSON_SCHEMA)
 
 
 class CreateNoteRequestSchema(BaseSchema):
@@ -132,14 +191,12 @@ class CreateNoteRequestSchema(BaseSchema):
     title = fields.String(required=True)    
 
 
-class CreateNoteDocumentSchema(BaseMongoSchema):
+class BulkCreateNoteRequestSchema(BaseSchema):
     """
-    Create note document schema
+    Bulk create note request schema
     """
 
-    author = ObjectIdField(required=True)
-    body = fields.String(required=True)
-    title = fields.String(required=True)
+    notes = fields.List(fields.Nested(CreateNoteRequestSchema), required=True, validate=validate.Length(min=1))
 
 
 class NoteAPIRequestSchema(BaseSchema):
@@ -162,27 +219,6 @@ class NoteAPIRequestSchema(BaseSchema):
         return data
 
 
-class NoteDocumentSchema(BaseSchema):
-    """
-    Note document schema
-    """
-
-    _id = ObjectIdField()
-    _createdAt = fields.DateTime()
-    _lastModifiedAt = fields.DateTime()
-    author = ObjectIdField()
-    title = fields.String()
-    body = fields.String()
-
-
-class NotesSchema(BaseSchema):
-    """
-    Notes schema
-    """
-    
-    notes = fields.List(fields.Nested(NoteDocumentSchema), required=True)
-
-
 class UpdateNoteRequestSchema(NoteAPIRequestSchema):
     """
     Update note request schema
@@ -5,6 +5,7 @@ Settings Module
 import logging
 import os
 
+import redis
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_pymongo import PyMongo
@@ -13,10 +14,19 @@ MONGO_URI = os.environ.get("MONGO_URI", "mongodb://localhost:27017")
 
 REDIS_URI = os.environ.get("REDIS_URI", "redis://localhost:6379")
 
+# Shared bounded pool with keepalive, so limiter checks run on warm sockets
+# instead of paying a TCP handshake whenever a fresh connection is needed.
+REDIS_POOL = redis.ConnectionPool.from_url(
+    REDIS_URI,
+    max_connections=64,
+    socket_keepalive=True,
+    socket_connect_timeout=30,
+)
+
 LIMITER = Limiter(
     key_func=get_remote_address,
     storage_uri=REDIS_URI,
-    storage_options={"socket_connect_timeout": 30},
+    storage_options={"connection_pool": REDIS_POOL},
 )
 
 LOGGER = logging.getLogger()
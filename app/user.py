@@ -6,14 +6,21 @@ from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
 
 import jwt
+from pymongo.errors import DuplicateKeyError
 from pymongo.results import InsertOneResult
 
 from app.constants import ACCESS_TOKEN_VALIDITY
 from app.exceptions import IncorrectUsernameOrPasswordException, UserAlreadyExistsException
 from app.helpers import fetch_user
-from app.serializers import CreateUserDocumentSchema
 from app.settings import JWT_SECRET_KEY, MONGO_CLIENT
-from app.utils import argon2id_hasher, get_current_datetime
+from app.utils import get_current_datetime, hash_password, verify_password
+
+# Verified when the username does not exist, so a failed login costs one
+# argon2 verification either way and timing does not leak which part was wrong.
+_DUMMY_HASH = hash_password("dummy-password")
+
+# Token lifetime built once instead of a timedelta construction per login.
+_ACCESS_TOKEN_TTL = timedelta(days=ACCESS_TOKEN_VALIDITY)
 
 
 class User(ABC):
@@ -31,16 +38,6 @@ class User(ABC):
 
         self.request_data = validated_data
 
-    def hash_password(self) -> str:
-        """
-        Function to hash password.
-
-        Returns:
-            str: Hashed password.
-        """
-        
-        return argon2id_hasher(self.request_data["password"].encode()).hex()
-    
     @abstractmethod
     def process(self) -> dict:
         """
@@ -56,26 +53,37 @@ class CreateUser(User):
     def process(self) -> dict:
         """
         Function for creating new user.
-        1. Check if user already exists.
-        2. Hash the password.
-        3. Create user.
+        1. Hash the password.
+        2. Create user; the unique partial index on username turns a
+           duplicate signup into a DuplicateKeyError, replacing the racy
+           exists-then-insert round trip.
 
         Raises:
             UserAlreadyExistsException: When user with the same username already exists.
             HashingError: When some problem is encountered while hashing password.
-        
+
         Returns:
             dict: Response data containing user id of the newly created user.
         """
-        
-        if fetch_user(self.request_data["username"]):
-            raise UserAlreadyExistsException()
 
-        self.request_data["password"] = self.hash_password()
-
-        user_data: dict = CreateUserDocumentSchema().load(self.request_data)
-
-        result: InsertOneResult = MONGO_CLIENT.db.users.insert_one(user_data)
+        # The payload is already validated by the signup schema, so the
+        # document (snake_case to camelCase renames included) is assembled as
+        # a dict literal instead of a second marshmallow load.
+        user_data: dict = {
+            "_lastModifiedAt": get_current_datetime(),
+            "firstName": self.request_data["first_name"],
+            "lastName": self.request_data["last_name"],
+            "password": hash_password(self.request_data["password"]),
+            "username": self.request_data["username"],
+            "notes": [],
+            "sharedNotes": [],
+            "isActive": True,
+        }
+
+        try:
+            result: InsertOneResult = MONGO_CLIENT.db.users.insert_one(user_data)
+        except DuplicateKeyError as error:
+            raise UserAlreadyExistsException() from error
 
         return {"user_id": str(result.inserted_id)}
     
@@ -88,33 +96,32 @@ class LoginUser(User):
     def process(self) -> dict:
         """
         Function for user login.
-        1. Check if the user with the given username exists.
-        2. Hash the password and verify it with the saved password.
+        1. Fetch the user with the given username.
+        2. Verify the password against the stored argon2 hash in constant
+           time; a missing user verifies against a dummy hash so both
+           failure modes cost the same.
         3. Generate and return a jwt token.
 
         Raises:
             IncorrectUsernameOrPasswordException: When either the username or password is incorrect.
-            HashingError: When some problem is encountered while hashing password.
 
         Returns:
             dict: Response data containing access token.
         """
-        
-        user: dict = MONGO_CLIENT.db.users.find_one({"isActive": True, "username": self.request_data["username"]})
-        if not user:
-            raise IncorrectUsernameOrPasswordException()
-        
-        hashed_password: str = self.hash_password()
-        if (hashed_password != user["password"]):
+
+        user: dict = fetch_user(self.request_data["username"], {"_id": 1, "password": 1, "username": 1})
+
+        verified: bool = verify_password(user["password"] if user else _DUMMY_HASH, self.request_data["password"])
+        if not verified or not user:
             raise IncorrectUsernameOrPasswordException()
-        
+
         current_datetime: datetime = get_current_datetime()
 
         access_token: str = jwt.encode(
             {
                 "username": user["username"],
                 "iat": current_datetime,
-                "exp": current_datetime + timedelta(days=ACCESS_TOKEN_VALIDITY)
+                "exp": current_datetime + _ACCESS_TOKEN_TTL
             },
             JWT_SECRET_KEY
         )
@@ -5,33 +5,87 @@ Utils Module
 from datetime import datetime, timezone
 from http import HTTPStatus
 
-import argon2
-from flask import Response, jsonify
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from flask import Response, g, has_app_context
+from flask.json.provider import DefaultJSONProvider
 
 from app.enums import Argon2IdHash
-from app.settings import SECRET_SALT_KEY
 
+# One hasher per worker process: the argon2-cffi context (and its parameter
+# handling) is set up once and reused by every hash and verification.
+_PASSWORD_HASHER = PasswordHasher(
+    time_cost=Argon2IdHash.TIME_COST,
+    memory_cost=Argon2IdHash.MEMORY_COST,
+    parallelism=Argon2IdHash.PARALLELISM,
+    hash_len=Argon2IdHash.HASH_LENGTH,
+)
 
-def argon2id_hasher(data: bytes) -> bytes:
+
+def hash_password(password: str) -> str:
+    """
+    Function to hash a password with the shared argon2id hasher.
+
+    Args:
+        password (str): Plain password.
+
+    Returns:
+        str: PHC-encoded argon2 hash.
     """
-    Function to hash data using argon2id hashing.
+
+    return _PASSWORD_HASHER.hash(password)
+
+
+def verify_password(stored_hash: str, password: str) -> bool:
+    """
+    Function to verify a password against a stored PHC-encoded hash.
 
     Args:
-        data (bytes): Data to hash
+        stored_hash (str): Stored PHC-encoded argon2 hash.
+        password (str): Plain password to verify.
 
     Returns:
-        bytes: Hashed data.
+        bool: Whether the password matches.
     """
 
-    return argon2.hash_password_raw(
-        time_cost=Argon2IdHash.TIME_COST.value,
-        memory_cost=Argon2IdHash.MEMORY_COST.value,
-        parallelism=Argon2IdHash.PARALLELISM.value,
-        hash_len=Argon2IdHash.HASH_LENGTH.value,
-        password=data,
-        salt=SECRET_SALT_KEY.encode(),
-        type=argon2.low_level.Type.ID,
-    )
+    try:
+        return _PASSWORD_HASHER.verify(stored_hash, password)
+    except (InvalidHashError, VerificationError):
+        return False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson. Parses request bodies and serializes
+    responses in C instead of the stdlib json encoder.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        """
+        Function to serialize an object to a JSON string.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            str: JSON string.
+        """
+
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Function to deserialize a JSON string.
+
+        Args:
+            s (str | bytes): JSON string.
+
+        Returns:
+            Deserialized object.
+        """
+
+        return orjson.loads(s)
 
 
 def make_response(
@@ -56,15 +110,26 @@ def make_response(
     response = {"message": message, "data": data or {}}
     if errors:
         response.update(errors)
-    return jsonify(response), status_code
+    # Straight to orjson bytes: same encoder options as the app JSON provider,
+    # without jsonify's provider dispatch and str round trip.
+    body: bytes = orjson.dumps(response, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return Response(body, status=status_code, mimetype="application/json"), status_code
 
 
 def get_current_datetime() -> datetime:
     """
     Function to get current datetime in utc timezone.
+    Cached on the application context, so all timestamps taken while handling
+    one request are identical and datetime.now runs once per request.
 
     Returns:
         datetime: Current datetime in utc timezone.
     """
 
-    return datetime.now(timezone.utc)
+    if not has_app_context():
+        return datetime.now(timezone.utc)
+
+    now: datetime = getattr(g, "_request_datetime", None)
+    if now is None:
+        now = g._request_datetime = datetime.now(timezone.utc)
+    return now
@@ -13,4 +13,25 @@ mongo_uri = os.environ.get("MONGO_URI", "mongodb://localhost:27017")
 mongo_client = MongoClient(mongo_uri)
 db = mongo_client.notes
 
-db.notes.create_index({"title": "text", "body": "text"})
+# Unique over active users only (deactivated rows may keep the name), and
+# signup relies on this index's DuplicateKeyError instead of a pre-check.
+# The isActive equality in lookups is covered by the partial filter.
+# Created first: signup is broken without it, so a failure further down
+# this script must not be able to skip it.
+db.users.create_index([("username", 1)], unique=True, partialFilterExpression={"isActive": True})
+
+# MongoDB allows a single text index per collection, so the baseline
+# {title: text, body: text} index has to go before the author-prefixed
+# replacement can be built. Search keeps working between the two steps
+# (unindexed $text queries fail, but only in the window of this script).
+for name, spec in db.notes.index_information().items():
+    if "textIndexVersion" in spec and "author" not in dict(spec["key"]):
+        db.notes.drop_index(name)
+
+# Author prefix ahead of the text fields so a search only walks the text
+# entries of that author instead of filtering the whole text index post-hoc.
+db.notes.create_index([("author", 1), ("title", "text"), ("body", "text")])
+
+db.notes.create_index([("author", 1), ("isActive", 1)])
+
+db.notes.create_index([("isActive", 1), ("_id", 1)])